@@ -1,95 +1,281 @@
 import pdfplumber
-import pandas as pd
+import csv
+import io
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from collections import defaultdict
+from functools import lru_cache
 import warnings
 
 warnings.filterwarnings('ignore')
 
+# Compiled once at import time - these run against every line of every page
+RE_COMMITTEE_NAME = re.compile(r'Francis Howell Families', re.IGNORECASE)
+RE_DATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+RE_PERIOD = re.compile(r'FROM\s+(\d{1,2}/\d{1,2}/\d{4})\s+THROUGH\s+(\d{1,2}/\d{1,2}/\d{4})')
+RE_ADDRESS = re.compile(r'\d+.*(?:Dr|Rd|St|Ave|Lane|Circle|Court|Street)')
+RE_CITY_STATE_ZIP = re.compile(r'[A-Za-z\s]+\s+[A-Z]{2}\s+\d{5}')
+RE_AMOUNT = re.compile(r'\$?\s*([\d,]+\.?\d*)')
+# All line-level tests as optional lookaheads, so one match classifies a line
+RE_LINE_FEATURES = re.compile(
+    r'(?:(?=(?P<address>' + RE_ADDRESS.pattern + r')))?'
+    r'(?:(?=.*?(?P<city_state>' + RE_CITY_STATE_ZIP.pattern + r')))?'
+    r'(?:(?=.*?' + RE_DATE.pattern.replace('(', '(?P<date>', 1) + r'))?'
+    r'(?:(?=.*?' + RE_AMOUNT.pattern.replace('(', '(?P<amount>', 1) + r'))?'
+    r'(?:(?=(?P<purpose>[a-zA-Z\s]+)\s+(?P<purpose_amount>[\d.]+)$))?'
+)
+AMOUNT_STRIP_TABLE = str.maketrans('', '', ',$')
+
+# Form labels that can never start a contributor/vendor name
+CONTRIBUTION_SKIP_PREFIXES = ('NAME:', 'ADDRESS:', 'CITY', 'EMPLOYER:', 'COMMITTEE:', '$', 'MONETARY', 'IN-KIND')
+EXPENDITURE_SKIP_PREFIXES = ('NAME:', 'ADDRESS:', 'CITY', '$', 'PAID', 'INCURRED')
+
+# Section/status markers - one pass per page tells us which sections it holds
+RE_SECTION_MARKERS = re.compile(
+    r'REPORT SUMMARY|CONTRIBUTIONS AND LOANS RECEIVED|EXPENDITURES|ITEMIZED|SUPPLEMENTAL|'
+    r'COMMITTEE QUARTERLY REPORT|AMENDED|AMENDING'
+)
+
+# Data sections a report is read for - later pages are skipped once all were seen
+DATA_SECTIONS = frozenset(('summary', 'contributions', 'expenditures'))
+
+# Values repeated on every row share a single string object
+MONETARY = sys.intern('Monetary')
+GENERAL = sys.intern('General')
+EMPTY = sys.intern('')
+
+# Report summary labels per field, primary label first then its fallback
+SUMMARY_LABELS = (
+    ('money_on_hand_beginning', (r'Money On Hand at the beginning',
+                                 r'beginning of\s+this reporting period')),
+    ('money_on_hand_ending', (r'Money On Hand at the close',
+                              r'close of this\s+reporting period')),
+    ('monetary_receipts_period', (r'All Monetary Contributions Received\s+This Period',
+                                  r'Monetary Contributions.*?This Period')),
+    ('total_expenditures_period', (r'Expenditures made by cash or check\s+this period',
+                                   r'Total All expenditures made this period')),
+)
+
+# Each label is searched on its own - labels can sit inside each other's gap
+# before the amount, so a single alternation would miss overlapping matches
+RE_SUMMARY_FIELDS = tuple(
+    (field, tuple(re.compile(rf'{label}[^$\d]*?(\d{{1,3}}(?:,\d{{3}})*\.?\d*)', re.IGNORECASE)
+                  for label in labels))
+    for field, labels in SUMMARY_LABELS
+)
+
+# Output files and their columns, in CSV order
+SUMMARIES_CSV = 'FHF_report_summaries.csv'
+CONTRIBUTIONS_CSV = 'FHF_contributions_received.csv'
+EXPENDITURES_CSV = 'FHF_expenditures_made.csv'
+CSV_BUFFER_SIZE = 1 << 17
+# PDFs up to this size are read into memory in one go before parsing
+MAX_IN_MEMORY_PDF_SIZE = 64 * 1024 * 1024
+
+SUMMARY_COLS = (
+    'filename', 'committee_name', 'report_type', 'period_from', 'period_through', 'file_date',
+    'is_amendment', 'money_on_hand_beginning', 'money_on_hand_ending', 'total_receipts_period',
+    'total_expenditures_period', 'monetary_receipts_period'
+)
+CONTRIBUTION_COLS = (
+    'contributor_name', 'contributor_address', 'date_received', 'individual_amount',
+    'aggregate_amount', 'contribution_type', 'employer', 'occupation',
+    'filename', 'report_period_from', 'report_period_through'
+)
+EXPENDITURE_COLS = (
+    'expense_category', 'amount', 'recipient_name', 'recipient_address', 'purpose', 'date_paid',
+    'filename', 'report_period_from', 'report_period_through'
+)
+
+
+class LineFeatures:
+    """Regex classification of a single table line, computed once per page"""
+    __slots__ = ('text', 'is_address', 'is_city_state', 'date', 'amount', 'purpose')
+
+    def __init__(self, text, is_address, is_city_state, date, amount, purpose):
+        self.text = text
+        self.is_address = is_address
+        self.is_city_state = is_city_state
+        self.date = date
+        self.amount = amount  # None when the line has no amount-like token
+        self.purpose = purpose  # (purpose, amount) for "Purpose 123.45" lines
+
+
+@lru_cache(maxsize=2048)
+def _parse_amount_cached(amount_str):
+    """Parse a non-empty amount string - reports repeat the same amounts a lot"""
+    # Remove commas and dollar signs
+    clean_amount = amount_str.translate(AMOUNT_STRIP_TABLE)
+
+    try:
+        return float(clean_amount)
+    except:
+        return 0.0
+
+
+def page_markers(text):
+    """Return the set of section markers present in a page's text"""
+    return frozenset(RE_SECTION_MARKERS.findall(text))
+
+
+def is_expenditures_page(markers):
+    """Itemized/supplemental expenditure pages carry both markers"""
+    return 'EXPENDITURES' in markers and ('ITEMIZED' in markers or 'SUPPLEMENTAL' in markers)
+
+
+def data_sections(markers):
+    """Which of the data sections (summary/contributions/expenditures) a page holds"""
+    sections = set()
+    if 'REPORT SUMMARY' in markers:
+        sections.add('summary')
+    if 'CONTRIBUTIONS AND LOANS RECEIVED' in markers:
+        sections.add('contributions')
+    if is_expenditures_page(markers):
+        sections.add('expenditures')
+    return sections
+
+
+def format_file_date(value):
+    """Write file dates the way DataFrame.to_csv did - date-only when there is no time part"""
+    if isinstance(value, datetime):
+        if value.hour or value.minute or value.second or value.microsecond:
+            return str(value)
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def iter_page_texts(pdf):
+    """Lazily yield (page_index, text) for pages with text, extracting on demand"""
+    for page_num, page in enumerate(pdf.pages):
+        text = page.extract_text()
+        if text:
+            yield page_num, text
+
+
+def open_pdf(pdf_path):
+    """Open a PDF with pdfplumber"""
+    path = Path(pdf_path)
+    if path.stat().st_size <= MAX_IN_MEMORY_PDF_SIZE:
+        # One large read instead of many small buffered reads while parsing
+        return pdfplumber.open(io.BytesIO(path.read_bytes()))
+    return pdfplumber.open(pdf_path)
+
 
 class FHFDataExtractor:
     def __init__(self, downloads_folder="downloads"):
         self.downloads_folder = downloads_folder
-        self.report_summaries = []
-        self.contributions = []
-        self.expenditures = []
+        # Rows are streamed straight to the CSV writers; only counts are kept
+        self.summary_writer = None
+        self.contribution_writer = None
+        self.expenditure_writer = None
+        self.summary_count = 0
+        self.contribution_count = 0
+        self.expenditure_count = 0
 
     def extract_all_data(self):
         """Main method to extract data from all PDFs"""
-        pdf_files = [f for f in os.listdir(self.downloads_folder) if f.endswith('.pdf')]
+        pdf_paths = [entry.path for entry in os.scandir(self.downloads_folder)
+                     if entry.name.endswith('.pdf') and entry.is_file()]
 
-        print(f"Found {len(pdf_files)} PDF files")
+        print(f"Found {len(pdf_paths)} PDF files")
 
-        # Process each PDF
+        # Process each PDF - files are independent, so parse them in parallel
         all_reports = {}  # For handling amendments
 
-        for pdf_file in pdf_files:
-            try:
-                print(f"Processing {pdf_file}...")
-                pdf_path = os.path.join(self.downloads_folder, pdf_file)
-                report_data = self.extract_pdf_data(pdf_path, pdf_file)
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(pdf_paths) // (4 * workers))
 
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for pdf_file, report_data, error in executor.map(_extract_one, pdf_paths, chunksize=chunksize):
+                if error:
+                    print(f"Error processing {pdf_file}: {error}")
+                    continue
+
+                print(f"Processed {pdf_file}")
                 if report_data:
                     # Store for amendment handling
                     key = (report_data['report_type'], report_data['period_from'], report_data['period_through'])
-                    if key not in all_reports or report_data['file_date'] > all_reports[key]['file_date']:
+                    latest = all_reports.get(key)
+                    if latest is None or report_data['file_date'] > latest['file_date']:
                         all_reports[key] = report_data
 
-            except Exception as e:
-                print(f"Error processing {pdf_file}: {str(e)}")
-                continue
-
-        # Process the latest versions only
-        for report_data in all_reports.values():
-            self.process_report_data(report_data)
-
-        # Create CSV files
-        self.create_csv_files()
+        # Write the latest versions only, straight to the three CSV files
+        with open(SUMMARIES_CSV, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as summaries_file, \
+                open(CONTRIBUTIONS_CSV, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as contributions_file, \
+                open(EXPENDITURES_CSV, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as expenditures_file:
+            self.summary_writer = csv.DictWriter(summaries_file, fieldnames=SUMMARY_COLS, lineterminator=os.linesep)
+            self.contribution_writer = csv.DictWriter(contributions_file, fieldnames=CONTRIBUTION_COLS, lineterminator=os.linesep)
+            self.expenditure_writer = csv.DictWriter(expenditures_file, fieldnames=EXPENDITURE_COLS, lineterminator=os.linesep)
+            for writer in (self.summary_writer, self.contribution_writer, self.expenditure_writer):
+                writer.writeheader()
+
+            for report_data in all_reports.values():
+                self.process_report_data(report_data)
+
+        print(f"Created {SUMMARIES_CSV} with {self.summary_count} records")
+        print(f"Created {CONTRIBUTIONS_CSV} with {self.contribution_count} records")
+        print(f"Created {EXPENDITURES_CSV} with {self.expenditure_count} records")
         print("Extraction complete!")
 
     def extract_pdf_data(self, pdf_path, filename):
         """Extract data from a single PDF"""
-        with pdfplumber.open(pdf_path) as pdf:
-            report_data = {
-                'filename': filename,
-                'pages': [],
-                'text_content': []
-            }
-
-            # Extract text from all pages
-            for page_num, page in enumerate(pdf.pages):
-                text = page.extract_text()
-                if text:
-                    report_data['text_content'].append(text)
-                    report_data['pages'].append(page_num + 1)
-
-            # Parse report info from first page
-            if report_data['text_content']:
-                first_page = report_data['text_content'][0]
-
-                # Extract basic report info
-                report_data.update(self.parse_cover_page(first_page))
-
-                # Extract financial data from all pages
-                report_data['summary'] = self.extract_summary_data(report_data['text_content'])
-                report_data['contributions'] = self.extract_contributions_data(report_data['text_content'])
-                report_data['expenditures'] = self.extract_expenditures_data(report_data['text_content'])
-
-                return report_data
+        with open_pdf(pdf_path) as pdf:
+            return self.parse_pdf(pdf, filename)
+
+    def parse_pdf(self, pdf, filename):
+        """Extract data from an opened PDF"""
+        report_data = {
+            'filename': filename,
+            'pages': [],
+            'text_content': []
+        }
+
+        # Extract text page by page, stopping once every data section has
+        # been read and the current page no longer belongs to any of them
+        markers = []
+        sections_seen = set()
+        for page_num, text in iter_page_texts(pdf):
+            marks = page_markers(text)
+            sections = data_sections(marks)
+            if sections_seen >= DATA_SECTIONS and not sections:
+                break
+
+            report_data['text_content'].append(text)
+            report_data['pages'].append(page_num + 1)
+            markers.append(marks)
+            sections_seen |= sections
+
+        # Parse report info from first page
+        if report_data['text_content']:
+            pages = report_data['text_content']
+
+            # Extract basic report info
+            report_data.update(self.parse_cover_page(pages[0], markers[0]))
+
+            # Extract financial data from all pages
+            report_data['summary'] = self.extract_summary_data(pages, markers)
+            report_data['contributions'] = self.extract_contributions_data(pages, markers)
+            report_data['expenditures'] = self.extract_expenditures_data(pages, markers)
+
+            return report_data
         return None
 
-    def parse_cover_page(self, text):
+    def parse_cover_page(self, text, markers=None):
         """Parse basic info from cover page"""
         data = {}
+        if markers is None:
+            markers = page_markers(text)
 
         # Committee name
-        name_match = re.search(r'Francis Howell Families', text, re.IGNORECASE)
+        name_match = RE_COMMITTEE_NAME.search(text)
         data['committee_name'] = 'Francis Howell Families' if name_match else 'Unknown'
 
         # Report date
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
+        date_match = RE_DATE.search(text)
         if date_match:
             try:
                 data['file_date'] = datetime.strptime(date_match.group(1), '%m/%d/%Y')
@@ -99,7 +285,7 @@ class FHFDataExtractor:
             data['file_date'] = datetime.now()
 
         # Period covered - look for FROM/THROUGH pattern
-        period_match = re.search(r'FROM\s+(\d{1,2}/\d{1,2}/\d{4})\s+THROUGH\s+(\d{1,2}/\d{1,2}/\d{4})', text)
+        period_match = RE_PERIOD.search(text)
         if period_match:
             data['period_from'] = period_match.group(1)
             data['period_through'] = period_match.group(2)
@@ -108,82 +294,53 @@ class FHFDataExtractor:
             data['period_through'] = ''
 
         # Report type
-        if 'COMMITTEE QUARTERLY REPORT' in text:
+        is_amendment = 'AMENDED' in markers or 'AMENDING' in markers
+        if 'COMMITTEE QUARTERLY REPORT' in markers:
             data['report_type'] = 'Quarterly'
-        elif 'AMENDED' in text or 'AMENDING' in text:
+        elif is_amendment:
             data['report_type'] = 'Quarterly (Amended)'
         else:
             data['report_type'] = 'Unknown'
 
         # Amendment status
-        data['is_amendment'] = 'AMENDED' in text or 'AMENDING' in text
+        data['is_amendment'] = is_amendment
 
         return data
 
-    def extract_summary_data(self, pages):
+    def extract_summary_data(self, pages, markers=None):
         """Extract financial summary data"""
         summary = {}
-
-        for page_text in pages:
-            if 'REPORT SUMMARY' in page_text:
-                # Extract key financial figures using more flexible patterns
-
-                # Money on hand at beginning
-                beginning_patterns = [
-                    r'Money On Hand at the beginning[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)',
-                    r'beginning of\s+this reporting period[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)'
-                ]
-                for pattern in beginning_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        summary['money_on_hand_beginning'] = self.parse_amount(match.group(1))
-                        break
-
-                # Money on hand at close
-                close_patterns = [
-                    r'Money On Hand at the close[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)',
-                    r'close of this\s+reporting period[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)'
-                ]
-                for pattern in close_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        summary['money_on_hand_ending'] = self.parse_amount(match.group(1))
-                        break
-
-                # Monetary contributions this period
-                contrib_patterns = [
-                    r'All Monetary Contributions Received\s+This Period[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)',
-                    r'Monetary Contributions.*?This Period[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)'
-                ]
-                for pattern in contrib_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        summary['monetary_receipts_period'] = self.parse_amount(match.group(1))
-                        break
-
-                # Expenditures made this period
-                expend_patterns = [
-                    r'Expenditures made by cash or check\s+this period[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)',
-                    r'Total All expenditures made this period[^$\d]*?(\d{1,3}(?:,\d{3})*\.?\d*)'
-                ]
-                for pattern in expend_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        summary['total_expenditures_period'] = self.parse_amount(match.group(1))
-                        break
+        if markers is None:
+            markers = [page_markers(text) for text in pages]
+
+        for page_text, page_marks in zip(pages, markers):
+            if 'REPORT SUMMARY' in page_marks:
+                for field, patterns in RE_SUMMARY_FIELDS:
+                    for pattern in patterns:
+                        match = pattern.search(page_text)
+                        if match:
+                            summary[field] = self.parse_amount(match.group(1))
+                            break
 
                 break
 
         return summary
 
-    def extract_contributions_data(self, pages):
+    def extract_contributions_data(self, pages, markers=None):
         """Extract contributions data from CONTRIBUTIONS AND LOANS RECEIVED pages"""
         contributions = []
+        contributions_started = False
+        if markers is None:
+            markers = [page_markers(text) for text in pages]
 
-        for page_text in pages:
-            if 'CONTRIBUTIONS AND LOANS RECEIVED' in page_text:
+        for page_text, page_marks in zip(pages, markers):
+            if 'CONTRIBUTIONS AND LOANS RECEIVED' in page_marks:
+                contributions_started = True
                 print("Found contributions page, parsing...")
                 contributions.extend(self.parse_contributions_table(page_text))
+            elif contributions_started:
+                # The section is contiguous - stop at the first page without it
+                break
 
         return contributions
 
@@ -191,39 +348,34 @@ class FHFDataExtractor:
         """Parse the contributions table structure"""
         contributions = []
 
-        # Split text into lines for easier parsing
-        lines = text.split('\n')
+        # Split and classify every line once up front
+        feats = self.classify_lines(text)
 
         # Find contribution entries by looking for patterns
         i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        while i < len(feats):
+            line = feats[i].text
 
             # Look for contributor name patterns (skip form field labels)
-            if (line and
-                    not line.startswith(
-                        ('NAME:', 'ADDRESS:', 'CITY', 'EMPLOYER:', 'COMMITTEE:', '$', 'MONETARY', 'IN-KIND')) and
-                    not 'SUBTOTAL' in line and
-                    not 'TOTAL' in line and
-                    len(line) < 100 and
-                    len(line) > 2):
+            if (2 < len(line) < 100 and
+                    not line.startswith(CONTRIBUTION_SKIP_PREFIXES) and
+                    'TOTAL' not in line):  # also covers SUBTOTAL
 
                 # This might be a contributor name, look ahead for address and amount
                 contributor_data = {'name': line}
 
                 # Look ahead for address, date, and amount
-                j = i + 1
-                while j < min(i + 10, len(lines)):  # Look ahead max 10 lines
-                    next_line = lines[j].strip()
+                end = min(i + 10, len(feats))  # Look ahead max 10 lines
+                for j in range(i + 1, end):
+                    feat = feats[j]
+                    next_line = feat.text
 
                     # Look for address (has numbers and street indicators)
-                    if (re.match(r'\d+.*(?:Dr|Rd|St|Ave|Lane|Circle|Court|Street)', next_line) and
-                            'address' not in contributor_data):
+                    if feat.is_address and 'address' not in contributor_data:
                         contributor_data['address'] = next_line
 
                     # Look for city/state/zip
-                    elif (re.search(r'[A-Za-z\s]+\s+[A-Z]{2}\s+\d{5}', next_line) and
-                          'city_state' not in contributor_data):
+                    elif feat.is_city_state and 'city_state' not in contributor_data:
                         contributor_data['city_state'] = next_line
 
                     # Look for employer/occupation (contains --)
@@ -234,26 +386,20 @@ class FHFDataExtractor:
                             contributor_data['occupation'] = parts[1].strip()
 
                     # Look for date and amount pattern
-                    elif re.search(r'(\d{1,2}/\d{1,2}/\d{4})', next_line):
-                        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', next_line)
-                        if date_match:
-                            contributor_data['date'] = date_match.group(1)
+                    elif feat.date:
+                        contributor_data['date'] = feat.date
 
                         # Look for amount in this line or nearby lines
-                        amount_match = re.search(r'\$?\s*([\d,]+\.?\d*)', next_line)
-                        if amount_match:
-                            contributor_data['amount'] = self.parse_amount(amount_match.group(1))
+                        if feat.amount is not None:
+                            contributor_data['amount'] = feat.amount
                         else:
                             # Check the line before or after for amount
-                            for check_line in [lines[j - 1] if j > 0 else '',
-                                               lines[j + 1] if j + 1 < len(lines) else '']:
-                                amount_match = re.search(r'\$?\s*([\d,]+\.?\d*)', check_line)
-                                if amount_match and self.parse_amount(amount_match.group(1)) > 0:
-                                    contributor_data['amount'] = self.parse_amount(amount_match.group(1))
+                            for check in (feats[j - 1] if j > 0 else None,
+                                          feats[j + 1] if j + 1 < len(feats) else None):
+                                if check is not None and check.amount is not None and check.amount > 0:
+                                    contributor_data['amount'] = check.amount
                                     break
 
-                    j += 1
-
                 # If we found enough data, create a contribution record
                 if ('name' in contributor_data and
                         'amount' in contributor_data and
@@ -269,7 +415,7 @@ class FHFDataExtractor:
                         'date_received': contributor_data.get('date', ''),
                         'individual_amount': contributor_data['amount'],
                         'aggregate_amount': contributor_data['amount'],  # For now, same as individual
-                        'contribution_type': 'Monetary',  # Default
+                        'contribution_type': MONETARY,  # Default
                         'employer': contributor_data.get('employer', ''),
                         'occupation': contributor_data.get('occupation', '')
                     })
@@ -277,21 +423,27 @@ class FHFDataExtractor:
                     print(f"  Found contributor: {contributor_data['name']} - ${contributor_data['amount']}")
 
                 # Skip ahead to avoid re-processing the same contributor
-                i = j
+                i = end
             else:
                 i += 1
 
         return contributions
 
-    def extract_expenditures_data(self, pages):
+    def extract_expenditures_data(self, pages, markers=None):
         """Extract expenditures data"""
         expenditures = []
+        expenditures_started = False
+        if markers is None:
+            markers = [page_markers(text) for text in pages]
 
-        for page_text in pages:
-            if ('EXPENDITURES' in page_text and
-                    ('ITEMIZED' in page_text or 'SUPPLEMENTAL' in page_text)):
+        for page_text, page_marks in zip(pages, markers):
+            if is_expenditures_page(page_marks):
+                expenditures_started = True
                 print("Found expenditures page, parsing...")
                 expenditures.extend(self.parse_expenditures_table(page_text))
+            elif expenditures_started:
+                # The section is contiguous - stop at the first page without it
+                break
 
         return expenditures
 
@@ -299,58 +451,45 @@ class FHFDataExtractor:
         """Parse the expenditures table structure"""
         expenditures = []
 
-        lines = text.split('\n')
+        feats = self.classify_lines(text)
 
         i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        while i < len(feats):
+            line = feats[i].text
 
             # Look for vendor/recipient names (skip form labels)
-            if (line and
-                    not line.startswith(('NAME:', 'ADDRESS:', 'CITY', '$', 'PAID', 'INCURRED')) and
-                    not 'SUBTOTAL' in line and
-                    not 'TOTAL' in line and
-                    not 'PURPOSE' in line and
-                    len(line) < 100 and
-                    len(line) > 2):
+            if (2 < len(line) < 100 and
+                    not line.startswith(EXPENDITURE_SKIP_PREFIXES) and
+                    'TOTAL' not in line and  # also covers SUBTOTAL
+                    'PURPOSE' not in line):
 
                 expense_data = {'vendor': line}
 
                 # Look ahead for address, purpose, amount, and date
-                j = i + 1
-                while j < min(i + 15, len(lines)):  # Look ahead max 15 lines
-                    next_line = lines[j].strip()
+                end = min(i + 15, len(feats))  # Look ahead max 15 lines
+                for j in range(i + 1, end):
+                    feat = feats[j]
+                    next_line = feat.text
 
                     # Look for address
-                    if (re.match(r'\d+.*(?:Dr|Rd|St|Ave|Lane|Circle|Court|Street)', next_line) and
-                            'address' not in expense_data):
+                    if feat.is_address and 'address' not in expense_data:
                         expense_data['address'] = next_line
 
                     # Look for city/state/zip
-                    elif (re.search(r'[A-Za-z\s]+\s+[A-Z]{2}\s+\d{5}', next_line) and
-                          'city_state' not in expense_data):
+                    elif feat.is_city_state and 'city_state' not in expense_data:
                         expense_data['city_state'] = next_line
 
                     # Look for purpose/description with amount
-                    elif re.search(r'^[a-zA-Z\s]+\s+([\d.]+)$', next_line):
-                        purpose_match = re.search(r'^([a-zA-Z\s]+)\s+([\d.]+)$', next_line)
-                        if purpose_match:
-                            expense_data['purpose'] = purpose_match.group(1).strip()
-                            expense_data['amount'] = self.parse_amount(purpose_match.group(2))
+                    elif feat.purpose:
+                        expense_data['purpose'], expense_data['amount'] = feat.purpose
 
                     # Look for date
-                    elif re.search(r'(\d{1,2}/\d{1,2}/\d{4})', next_line):
-                        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', next_line)
-                        if date_match:
-                            expense_data['date'] = date_match.group(1)
+                    elif feat.date:
+                        expense_data['date'] = feat.date
 
                         # Also check for amount in same line if not found yet
-                        if 'amount' not in expense_data:
-                            amount_match = re.search(r'([\d,]+\.?\d*)', next_line)
-                            if amount_match:
-                                expense_data['amount'] = self.parse_amount(amount_match.group(1))
-
-                    j += 1
+                        if 'amount' not in expense_data and feat.amount is not None:
+                            expense_data['amount'] = feat.amount
 
                 # If we found enough data, create an expenditure record
                 if ('vendor' in expense_data and
@@ -362,7 +501,7 @@ class FHFDataExtractor:
                         full_address += ', ' + expense_data['city_state']
 
                     expenditures.append({
-                        'expense_category': expense_data.get('purpose', 'General'),
+                        'expense_category': expense_data.get('purpose', GENERAL),
                         'amount': expense_data['amount'],
                         'recipient_name': expense_data['vendor'],
                         'recipient_address': full_address,
@@ -373,35 +512,54 @@ class FHFDataExtractor:
                     print(f"  Found expenditure: {expense_data['vendor']} - ${expense_data['amount']}")
 
                 # Skip ahead to avoid re-processing
-                i = j
+                i = end
             else:
                 i += 1
 
         return expenditures
 
+    def classify_lines(self, text):
+        """Split page text into lines and run each line-level regex once per line"""
+        feats = []
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            m = RE_LINE_FEATURES.match(line)
+            amount = m.group('amount')
+            purpose = m.group('purpose')
+
+            feats.append(LineFeatures(
+                text=line,
+                is_address=m.group('address') is not None,
+                is_city_state=m.group('city_state') is not None,
+                date=m.group('date'),
+                amount=self.parse_amount(amount) if amount is not None else None,
+                purpose=((purpose.strip(), self.parse_amount(m.group('purpose_amount')))
+                         if purpose is not None else None)
+            ))
+
+        return feats
+
     def parse_amount(self, amount_str):
         """Parse amount string to float"""
         if not amount_str:
             return 0.0
-
-        # Remove commas and dollar signs
-        clean_amount = re.sub(r'[,$]', '', str(amount_str))
-
-        try:
-            return float(clean_amount)
-        except:
-            return 0.0
+        return _parse_amount_cached(str(amount_str))
 
     def process_report_data(self, report_data):
         """Process a single report's data"""
+        # Per-report values are repeated on every row - intern them once
+        filename = sys.intern(report_data['filename'])
+        period_from = sys.intern(report_data.get('period_from', EMPTY))
+        period_through = sys.intern(report_data.get('period_through', EMPTY))
+
         # Add to report summaries
         summary_row = {
-            'filename': report_data['filename'],
+            'filename': filename,
             'committee_name': report_data.get('committee_name', ''),
             'report_type': report_data.get('report_type', ''),
-            'period_from': report_data.get('period_from', ''),
-            'period_through': report_data.get('period_through', ''),
-            'file_date': report_data.get('file_date', ''),
+            'period_from': period_from,
+            'period_through': period_through,
+            'file_date': format_file_date(report_data.get('file_date', '')),
             'is_amendment': report_data.get('is_amendment', False),
             'money_on_hand_beginning': report_data['summary'].get('money_on_hand_beginning', 0.0),
             'money_on_hand_ending': report_data['summary'].get('money_on_hand_ending', 0.0),
@@ -409,65 +567,46 @@ class FHFDataExtractor:
             'total_expenditures_period': report_data['summary'].get('total_expenditures_period', 0.0),
             'monetary_receipts_period': report_data['summary'].get('monetary_receipts_period', 0.0)
         }
-        self.report_summaries.append(summary_row)
+        self.summary_writer.writerow(summary_row)
+        self.summary_count += 1
 
         # Add contributions
         for contrib in report_data['contributions']:
-            contrib_row = contrib.copy()
-            contrib_row['filename'] = report_data['filename']
-            contrib_row['report_period_from'] = report_data.get('period_from', '')
-            contrib_row['report_period_through'] = report_data.get('period_through', '')
-            self.contributions.append(contrib_row)
+            self.contribution_writer.writerow({
+                **contrib,
+                'filename': filename,
+                'report_period_from': period_from,
+                'report_period_through': period_through
+            })
+            self.contribution_count += 1
 
         # Add expenditures
-        period_start = report_data.get('period_from', '')
         for expense in report_data['expenditures']:
-            expense_row = expense.copy()
-            expense_row['filename'] = report_data['filename']
-            expense_row['report_period_from'] = report_data.get('period_from', '')
-            expense_row['report_period_through'] = report_data.get('period_through', '')
-            # Use period start date if no specific date
-            if not expense_row['date_paid']:
-                expense_row['date_paid'] = period_start
-            self.expenditures.append(expense_row)
-
-    def create_csv_files(self):
-        """Create the three CSV output files"""
-
-        # Report Summaries
-        if self.report_summaries:
-            df_summaries = pd.DataFrame(self.report_summaries)
-            df_summaries.to_csv('FHF_report_summaries.csv', index=False)
-            print(f"Created FHF_report_summaries.csv with {len(df_summaries)} records")
-
-        # Contributions
-        if self.contributions:
-            df_contributions = pd.DataFrame(self.contributions)
-            df_contributions.to_csv('FHF_contributions_received.csv', index=False)
-            print(f"Created FHF_contributions_received.csv with {len(df_contributions)} records")
-        else:
-            # Create empty file with headers
-            df_contributions = pd.DataFrame(columns=[
-                'filename', 'contributor_name', 'contributor_address', 'date_received',
-                'individual_amount', 'aggregate_amount', 'contribution_type', 'employer',
-                'occupation', 'report_period_from', 'report_period_through'
-            ])
-            df_contributions.to_csv('FHF_contributions_received.csv', index=False)
-            print("Created empty FHF_contributions_received.csv with headers")
-
-        # Expenditures
-        if self.expenditures:
-            df_expenditures = pd.DataFrame(self.expenditures)
-            df_expenditures.to_csv('FHF_expenditures_made.csv', index=False)
-            print(f"Created FHF_expenditures_made.csv with {len(df_expenditures)} records")
-        else:
-            # Create empty file with headers
-            df_expenditures = pd.DataFrame(columns=[
-                'filename', 'expense_category', 'amount', 'recipient_name', 'recipient_address',
-                'purpose', 'date_paid', 'report_period_from', 'report_period_through'
-            ])
-            df_expenditures.to_csv('FHF_expenditures_made.csv', index=False)
-            print("Created empty FHF_expenditures_made.csv with headers")
+            self.expenditure_writer.writerow({
+                **expense,
+                # Use period start date if no specific date
+                'date_paid': expense['date_paid'] or period_from,
+                'filename': filename,
+                'report_period_from': period_from,
+                'report_period_through': period_through
+            })
+            self.expenditure_count += 1
+
+
+def _extract_one(pdf_path):
+    """Worker process entry point: parse a single PDF.
+
+    Returns (filename, report_data, error) so failures are reported by the parent.
+    """
+    filename = os.path.basename(pdf_path)
+    try:
+        report_data = FHFDataExtractor().extract_pdf_data(pdf_path, filename)
+        if report_data:
+            # Raw page text is not needed after parsing - don't ship it back
+            report_data.pop('text_content', None)
+        return filename, report_data, None
+    except Exception as e:
+        return filename, None, str(e)
 
 
 def main():
@@ -486,14 +625,14 @@ def main():
     extractor.extract_all_data()
 
     print("\nExtraction Summary:")
-    print(f"- Report Summaries: {len(extractor.report_summaries)} records")
-    print(f"- Contributions: {len(extractor.contributions)} records")
-    print(f"- Expenditures: {len(extractor.expenditures)} records")
+    print(f"- Report Summaries: {extractor.summary_count} records")
+    print(f"- Contributions: {extractor.contribution_count} records")
+    print(f"- Expenditures: {extractor.expenditure_count} records")
 
     print("\nFiles created:")
-    print("- FHF_report_summaries.csv")
-    print("- FHF_contributions_received.csv")
-    print("- FHF_expenditures_made.csv")
+    print(f"- {SUMMARIES_CSV}")
+    print(f"- {CONTRIBUTIONS_CSV}")
+    print(f"- {EXPENDITURES_CSV}")
 
 
 if __name__ == "__main__":
@@ -4,12 +4,13 @@ import os
 
 def scan_all_pdf_content():
     downloads_folder = "downloads"
-    pdf_files = [f for f in os.listdir(downloads_folder) if f.endswith('.pdf')]
+    pdf_files = [entry for entry in os.scandir(downloads_folder)
+                 if entry.name.endswith('.pdf') and entry.is_file()]
 
     # Look at the first PDF
     if pdf_files:
-        pdf_path = os.path.join(downloads_folder, pdf_files[0])
-        print(f"Scanning all pages of: {pdf_files[0]}")
+        pdf_path = pdf_files[0].path
+        print(f"Scanning all pages of: {pdf_files[0].name}")
         print("=" * 60)
 
         with pdfplumber.open(pdf_path) as pdf:
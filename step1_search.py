@@ -2,6 +2,16 @@
 Step 1: Fixed - Click on MECID link instead of committee name
 """
 
+import os
+import time
+
+# DEBUG_HOLD=<seconds> leaves the committee page open at the end for a look around
+try:
+    HOLD_SECONDS = max(0, int(os.environ.get("DEBUG_HOLD") or 0))
+except ValueError:
+    HOLD_SECONDS = 0
+
+
 def search_and_select_committee_fixed():
     print("=== STEP 1: FIXED VERSION ===")
 
@@ -13,20 +23,24 @@ def search_and_select_committee_fixed():
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         from webdriver_manager.chrome import ChromeDriverManager
-        import time
 
         # Setup browser
         chrome_options = Options()
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--window-size=1920,1080')
+        # Only forms and links are used here - skip downloading images and fonts
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2
+        })
 
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=chrome_options)
 
         print("1. Going to MEC search page...")
         driver.get("https://mec.mo.gov/MEC/Campaign_Finance/CFSearch.aspx#gsc.tab=0")
-        time.sleep(3)
 
         print("2. Filling search form...")
         wait = WebDriverWait(driver, 10)
@@ -38,10 +52,11 @@ def search_and_select_committee_fixed():
 
         search_button = driver.find_element(By.NAME, "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$btnSearch")
         search_button.click()
-        time.sleep(4)
 
         print("3. Looking for results...")
-        results_table = driver.find_element(By.ID, "ContentPlaceHolder_ContentPlaceHolder1_gvResults")
+        results_table = wait.until(
+            EC.presence_of_element_located((By.ID, "ContentPlaceHolder_ContentPlaceHolder1_gvResults"))
+        )
         print("   ✓ Found results table")
 
         print("4. Looking for MECID link (not committee name)...")
@@ -55,7 +70,10 @@ def search_and_select_committee_fixed():
 
             print("5. Clicking on MECID link...")
             mecid_link.click()
-            time.sleep(3)
+            try:
+                wait.until(EC.url_contains("CommInfo.aspx"))
+            except Exception:
+                pass  # Reported by the URL check below
 
             # Check if we're on committee page
             current_url = driver.current_url
@@ -67,8 +85,9 @@ def search_and_select_committee_fixed():
                 print("\n🎉 STEP 1 SUCCESS! 🎉")
                 print("Ready for Step 2: Navigate to Reports tab")
 
-                print("\nKeeping browser open for 10 seconds so you can see the committee page...")
-                time.sleep(10)
+                if HOLD_SECONDS:
+                    print(f"\nKeeping browser open for {HOLD_SECONDS} seconds so you can see the committee page...")
+                    time.sleep(HOLD_SECONDS)
 
                 driver.quit()
                 return True
@@ -77,15 +96,18 @@ def search_and_select_committee_fixed():
         else:
             print("   ✗ Could not find MECID link starting with 'C2116'")
             # Fallback: look for any links that start with 'C'
-            all_links = results_table.find_elements(By.TAG_NAME, "a")
+            # Read all link texts in one round-trip rather than one per link
+            link_texts = driver.execute_script(
+                "return Array.from(arguments[0].getElementsByTagName('a')).map(a => a.innerText.trim());",
+                results_table)
             print("   Available links:")
-            for link in all_links:
-                link_text = link.text.strip()
+            for link_text in link_texts:
                 if link_text.startswith('C'):
                     print(f"     - {link_text}")
 
-        print("\nKeeping browser open for debugging...")
-        time.sleep(15)
+        if HOLD_SECONDS:
+            print("\nKeeping browser open for debugging...")
+            time.sleep(HOLD_SECONDS)
         driver.quit()
         return False
 
@@ -1,3 +1,12 @@
+import os
+import time
+
+# Set DEBUG_HOLD (seconds) to keep Chrome open after the test
+try:
+    HOLD_SECONDS = max(0, int(os.environ.get("DEBUG_HOLD") or 0))
+except ValueError:
+    HOLD_SECONDS = 0
+
 print("=== STEP 1 SIMPLE TEST ===")
 print("Starting...")
 
@@ -7,7 +16,6 @@ try:
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
     from webdriver_manager.chrome import ChromeDriverManager
-    import time
 
     print("2. Setting up browser...")
     chrome_options = Options()
@@ -15,25 +23,41 @@ try:
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--window-size=1920,1080')
+    # We only need the form, so don't wait on or fetch images and fonts
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
 
     print("3. Starting browser...")
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(30)
 
     print("4. Browser opened! Going to MEC search page...")
     mec_url = "https://mec.mo.gov/MEC/Campaign_Finance/CFSearch.aspx#gsc.tab=0"
     driver.get(mec_url)
 
     print("5. Waiting for page to load...")
-    time.sleep(5)
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    # Wait for the committee input itself instead of a fixed pause. On a
+    # timeout, carry on - the input lookup below prints the failure
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located(
+            (By.NAME, "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$txtComm")))
+    except Exception:
+        pass
 
     print("6. Current URL:", driver.current_url)
     print("7. Page title:", driver.title)
 
     print("8. Looking for committee input field...")
     try:
-        from selenium.webdriver.common.by import By
-
         committee_input = driver.find_element(By.NAME, "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$txtComm")
         print("   ✓ Found committee input field!")
 
@@ -45,8 +69,9 @@ try:
     except Exception as e:
         print(f"   ✗ Could not find input field: {e}")
 
-    print("10. Keeping browser open for 10 seconds so you can see...")
-    time.sleep(10)
+    if HOLD_SECONDS:
+        print(f"10. Keeping browser open for {HOLD_SECONDS} seconds so you can see...")
+        time.sleep(HOLD_SECONDS)
 
     print("11. Closing browser...")
     driver.quit()
@@ -5,6 +5,56 @@ Builds on Step 1 success - finds and clicks the Reports tab on the committee pag
 VERSION: 1.0 - Foundation Step 2
 """
 
+import os
+import time
+from functools import lru_cache
+
+# How long to leave the reports page open before quitting, from DEBUG_HOLD
+try:
+    HOLD_SECONDS = max(0, int(os.environ.get("DEBUG_HOLD") or 0))
+except ValueError:
+    HOLD_SECONDS = 0
+
+# Links whose text contains "report" in any letter case
+REPORT_LINK_XPATH = ("//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+                     "'abcdefghijklmnopqrstuvwxyz'), 'report')]")
+
+
+@lru_cache(maxsize=1)
+def chromedriver_path():
+    """Install/locate ChromeDriver once per run instead of once per browser"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def create_driver():
+    """Start Chrome with the settings shared by both Step 2 tests"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--window-size=1920,1080')
+    # Only forms and links are used here - skip downloading images and fonts
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2
+    })
+
+    service = Service(chromedriver_path())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+def first_link_texts(driver, limit):
+    """Text of the first `limit` links on the page, read in one round-trip"""
+    return driver.execute_script(
+        "return Array.from(document.getElementsByTagName('a'))"
+        ".slice(0, arguments[0]).map(a => a.innerText.trim());",
+        limit)
+
 
 def run_step1_and_step2():
     """Run Step 1 (search committee) then Step 2 (navigate to Reports tab)"""
@@ -12,28 +62,16 @@ def run_step1_and_step2():
     print("=== RUNNING STEP 1 + STEP 2 ===")
 
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-        import time
 
         # Setup browser
-        chrome_options = Options()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = create_driver()
 
         # STEP 1: Get to committee page (we know this works)
         print("STEP 1: Getting to committee page...")
         driver.get("https://mec.mo.gov/MEC/Campaign_Finance/CFSearch.aspx#gsc.tab=0")
-        time.sleep(3)
 
         # Fill search form
         wait = WebDriverWait(driver, 10)
@@ -45,13 +83,17 @@ def run_step1_and_step2():
 
         search_button = driver.find_element(By.NAME, "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$btnSearch")
         search_button.click()
-        time.sleep(4)
 
         # Click MECID link
-        results_table = driver.find_element(By.ID, "ContentPlaceHolder_ContentPlaceHolder1_gvResults")
+        results_table = wait.until(
+            EC.presence_of_element_located((By.ID, "ContentPlaceHolder_ContentPlaceHolder1_gvResults"))
+        )
         mecid_links = results_table.find_elements(By.PARTIAL_LINK_TEXT, "C2116")
         mecid_links[0].click()
-        time.sleep(3)
+        try:
+            wait.until(EC.url_contains("CommInfo.aspx"))
+        except Exception:
+            pass  # Reported by the URL check below
 
         # Verify we're on committee page
         current_url = driver.current_url
@@ -72,7 +114,12 @@ def run_step1_and_step2():
 
             print("   Clicking Reports tab...")
             reports_link.click()
-            time.sleep(3)
+            # Wait for the year sections of the reports table instead of a fixed pause
+            try:
+                wait.until(EC.presence_of_element_located(
+                    (By.ID, "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")))
+            except Exception:
+                pass  # Fall back to the page text check below
 
             # Check if we're on reports page
             current_url = driver.current_url
@@ -94,8 +141,9 @@ def run_step1_and_step2():
                 print("Successfully navigated to Reports tab")
                 print("Ready for Step 3: Find and expand year sections")
 
-                print("\nKeeping browser open for 10 seconds to see reports page...")
-                time.sleep(10)
+                if HOLD_SECONDS:
+                    print(f"\nKeeping browser open for {HOLD_SECONDS} seconds to see reports page...")
+                    time.sleep(HOLD_SECONDS)
 
                 driver.quit()
                 return True
@@ -108,14 +156,14 @@ def run_step1_and_step2():
             # Method 2: Look for partial text match
             try:
                 print("   Trying method 2: partial text match...")
-                all_links = driver.find_elements(By.TAG_NAME, "a")
+                # Let the browser do the case-insensitive text match in one query
+                # instead of reading each link's text back one at a time. The
+                # XPath also matches hidden links, so take the first visible one
+                matches = driver.find_elements(By.XPATH, REPORT_LINK_XPATH)
 
-                reports_link = None
-                for link in all_links:
-                    if "report" in link.text.lower():
-                        reports_link = link
-                        print(f"   Found potential reports link: '{link.text}'")
-                        break
+                reports_link = next((link for link in matches if link.is_displayed()), None)
+                if reports_link:
+                    print(f"   Found potential reports link: '{reports_link.text}'")
 
                 if reports_link:
                     reports_link.click()
@@ -130,16 +178,15 @@ def run_step1_and_step2():
         # Show all available links for debugging
         print("\n   Available links on committee page:")
         try:
-            all_links = driver.find_elements(By.TAG_NAME, "a")
-            for i, link in enumerate(all_links[:10]):  # Show first 10 links
-                link_text = link.text.strip()
+            for i, link_text in enumerate(first_link_texts(driver, 10)):  # Show first 10 links
                 if link_text:  # Only show non-empty link text
                     print(f"     {i + 1}. '{link_text}'")
         except:
             pass
 
-        print("\nKeeping browser open for debugging...")
-        time.sleep(15)
+        if HOLD_SECONDS:
+            print("\nKeeping browser open for debugging...")
+            time.sleep(HOLD_SECONDS)
         driver.quit()
         return False
 
@@ -159,49 +206,47 @@ def test_step2_only():
     print("(Manually going to Francis Howell Families page)")
 
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
-        from webdriver_manager.chrome import ChromeDriverManager
-        import time
-
-        chrome_options = Options()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = create_driver()
 
         # Go directly to Francis Howell Families committee page
         print("Going directly to committee page...")
         driver.get("https://mec.mo.gov/MEC/Campaign_Finance/CommInfo.aspx?MECID=C211676")
-        time.sleep(5)
+        wait = WebDriverWait(driver, 10)
 
         print("Looking for Reports tab...")
         try:
-            reports_link = driver.find_element(By.LINK_TEXT, "Reports")
+            reports_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Reports")))
             print("   ✓ Found Reports tab")
 
             reports_link.click()
-            time.sleep(3)
             print("   ✓ Clicked Reports tab")
 
-            print("\nStep 2 complete! Keeping browser open...")
-            time.sleep(15)
+            try:
+                wait.until(EC.presence_of_element_located(
+                    (By.ID, "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")))
+                print("   ✓ Reports table loaded")
+            except Exception:
+                print("   ? Clicked Reports but the reports table did not load")
+
+            if HOLD_SECONDS:
+                print("\nStep 2 complete! Keeping browser open...")
+                time.sleep(HOLD_SECONDS)
 
         except Exception as e:
             print(f"   ✗ Could not find Reports tab: {e}")
 
             # Show available links
             print("   Available links:")
-            all_links = driver.find_elements(By.TAG_NAME, "a")
-            for link in all_links[:10]:
-                if link.text.strip():
-                    print(f"     - '{link.text.strip()}'")
+            for link_text in first_link_texts(driver, 10):
+                if link_text:
+                    print(f"     - '{link_text}'")
 
-            time.sleep(15)
+            if HOLD_SECONDS:
+                time.sleep(HOLD_SECONDS)
 
         driver.quit()
 
@@ -215,8 +260,9 @@ if __name__ == "__main__":
     print("Choose test method:")
     print("1. Run Step 1 + Step 2 together")
     print("2. Test Step 2 only (go directly to committee page)")
+    print("3. Run both tests (ChromeDriver is only set up once)")
 
-    choice = input("Enter 1 or 2: ")
+    choice = input("Enter 1, 2 or 3: ")
 
     if choice == "1":
         success = run_step1_and_step2()
@@ -226,5 +272,9 @@ if __name__ == "__main__":
             print("\n❌ FAILED - Need to debug")
     elif choice == "2":
         test_step2_only()
+    elif choice == "3":
+        success = run_step1_and_step2()
+        print("\n✅ STEP 1 + 2 COMPLETE" if success else "\n❌ STEP 1 + 2 FAILED")
+        test_step2_only()
     else:
         print("Invalid choice")
\ No newline at end of file
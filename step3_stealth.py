@@ -2,10 +2,17 @@
 Step 3: Fixed Stealth Version - Simplified anti-detection without problematic mouse movements
 """
 
+import os
 import random
 import time
 from selenium.webdriver.common.action_chains import ActionChains
 
+# Optional pause before closing the browser (DEBUG_HOLD, in seconds)
+try:
+    HOLD_SECONDS = max(0, int(os.environ.get("DEBUG_HOLD") or 0))
+except ValueError:
+    HOLD_SECONDS = 0
+
 
 class StealthBrowser:
     """Helper class for human-like browser interactions - fixed version"""
@@ -130,16 +137,8 @@ def run_steps_1_2_3_fixed():
 
         stealth.mimic_reading(2)  # "Read" the reports page
 
-        # Look for year content
-        page_source = driver.page_source
-        years_found = []
-        for year in ['2025', '2024', '2023', '2022', '2021']:
-            if year in page_source:
-                years_found.append(year)
-
-        print(f"   Years found: {years_found}")
-
-        # Look for expand-type elements
+        # Look for year content, the main reports table and expand-type
+        # elements from one snapshot of the page instead of separate reads
         expand_elements_found = 0
         expand_selectors = [
             "input[id*='Img'][id*='Right']",  # Based on your project HTML
@@ -148,31 +147,45 @@ def run_steps_1_2_3_fixed():
             "span.year-span"
         ]
 
-        for selector in expand_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"   Found {len(elements)} elements: {selector}")
-                    expand_elements_found += len(elements)
-            except:
-                pass
-
-        # Look for the main reports table
-        try:
-            main_table = driver.find_element(By.ID, "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
+        snapshot = driver.execute_script(
+            """
+            const html = document.documentElement.outerHTML;
+            const table = document.getElementById(arguments[2]);
+            // Search only inside the reports table when we have it
+            const root = table || document;
+            return {
+                years: arguments[0].filter(y => html.includes(y)),
+                table: table !== null,
+                counts: arguments[1].map(s => root.querySelectorAll(s).length)
+            };
+            """,
+            ['2025', '2024', '2023', '2022', '2021'],
+            expand_selectors,
+            "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
+
+        years_found = snapshot['years']
+        print(f"   Years found: {years_found}")
+
+        if snapshot['table']:
             print("   ✓ Found main reports table")
-        except:
+        else:
             print("   ? Main reports table not found")
 
+        for selector, count in zip(expand_selectors, snapshot['counts']):
+            if count:
+                print(f"   Found {count} elements: {selector}")
+                expand_elements_found += count
+
         print(f"\n   STEP 3 ANALYSIS COMPLETE:")
         print(f"   - Years detected: {len(years_found)}")
         print(f"   - Expand elements: {expand_elements_found}")
         print("   - Ready to attempt expansion in Step 4")
 
         # Manual inspection time
-        print("\nKeeping browser open for manual inspection...")
-        print("Look for year sections and expand buttons")
-        time.sleep(15)
+        if HOLD_SECONDS:
+            print("\nKeeping browser open for manual inspection...")
+            print("Look for year sections and expand buttons")
+            time.sleep(HOLD_SECONDS)
 
         driver.quit()
         return True
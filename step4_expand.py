@@ -5,10 +5,41 @@ Builds on Steps 1-3 success, adds year expansion with continued anti-detection
 VERSION: 1.0 - Controlled Expansion
 """
 
+import os
 import random
 import time
+from lxml import etree
+from lxml import html as lxml_html
 from selenium.webdriver.common.action_chains import ActionChains
 
+# Report link queries, parsed once and reused on every page snapshot
+BTN_LINKS_XPATH = etree.XPath("//a[contains(concat(' ', normalize-space(@class), ' '), ' btn-link ')]")
+GENERATOR_LINKS_XPATH = etree.XPath("//a[contains(@href, 'Generator.aspx')]")
+
+# Rendered text of every visible link - hidden links (collapsed years) are
+# skipped, like Selenium's .text which is empty for them
+VISIBLE_LINK_TEXTS_JS = """
+return Array.from(document.getElementsByTagName('a'))
+    .filter(a => a.getClientRects().length > 0)
+    .map(a => a.innerText.trim());
+"""
+
+# Keys (data-cpid or link text) of the report links currently visible in the
+# reports table - compared before and after expanding a year
+VISIBLE_REPORT_LINKS_JS = """
+var table = document.getElementById('ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside');
+if (!table) return [];
+return Array.from(table.querySelectorAll('a.btn-link, a[data-cpid]'))
+    .filter(a => a.getClientRects().length > 0)
+    .map(a => a.getAttribute('data-cpid') || a.textContent.trim());
+"""
+
+# DEBUG_HOLD=20 gives time to inspect the expanded year before the browser closes
+try:
+    HOLD_SECONDS = max(0, int(os.environ.get("DEBUG_HOLD") or 0))
+except ValueError:
+    HOLD_SECONDS = 0
+
 
 class StealthBrowser:
     """Helper class for human-like browser interactions"""
@@ -129,15 +160,18 @@ def run_steps_1_2_3_4():
 
         # Find expand buttons and year labels
         expand_buttons = main_table.find_elements(By.CSS_SELECTOR, "input[id*='ImgRptRight']")
-        year_labels = main_table.find_elements(By.CSS_SELECTOR, "span[id*='lblYear']")
+        # Read every year label's text in one round-trip instead of one per label
+        year_labels = driver.execute_script(
+            "return Array.from(arguments[0].querySelectorAll(\"span[id*='lblYear']\"))"
+            ".map(e => e.innerText.trim());",
+            main_table)
 
         print(f"   Found {len(expand_buttons)} expand buttons")
         print(f"   Found {len(year_labels)} year labels")
 
         # Find 2025 section
         target_expand_button = None
-        for i, year_label in enumerate(year_labels):
-            year_text = year_label.text.strip()
+        for i, year_text in enumerate(year_labels):
             print(f"   Year label {i}: '{year_text}'")
 
             if "2025" in year_text:
@@ -154,11 +188,18 @@ def run_steps_1_2_3_4():
             stealth.human_delay(1, 2)
 
             # Click the expand button
+            links_before = set(driver.execute_script(VISIBLE_REPORT_LINKS_JS))
             stealth.human_click(target_expand_button)
 
             # Wait for content to load
             print("   [Waiting for 2025 reports to load...]")
-            time.sleep(5)  # Give time for dynamic content to load
+            # Poll until a report link that was not visible before the click shows
+            # up; on timeout the verification below reports what (if anything) loaded
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.25).until(
+                    lambda d: not links_before.issuperset(d.execute_script(VISIBLE_REPORT_LINKS_JS)))
+            except Exception:
+                print("   [Report links did not appear within 10s]")
 
             # STEP 4 VERIFICATION: Look for individual reports
             print("\n   STEP 4 VERIFICATION: Looking for individual reports...")
@@ -167,23 +208,28 @@ def run_steps_1_2_3_4():
                 # Look for report links that are now visible
                 # Based on project knowledge, these should be numeric links or btn-link class
 
-                # Method 1: Look for numeric links (report IDs)
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                numeric_links = [link for link in all_links if link.text.strip().isdigit()]
+                # Method 1: Look for numeric links (report IDs) that are actually
+                # shown - all link texts come back in one round-trip
+                link_texts = driver.execute_script(VISIBLE_LINK_TEXTS_JS)
+                numeric_links = [text for text in link_texts if text.isdigit()]
 
                 print(f"   Found {len(numeric_links)} numeric links (potential reports)")
 
                 # Show first few numeric links
-                for i, link in enumerate(numeric_links[:5]):
-                    link_text = link.text.strip()
-                    print(f"     Report {i + 1}: {link_text}")
+                if numeric_links:
+                    print("\n".join(f"     Report {i + 1}: {link_text}"
+                                    for i, link_text in enumerate(numeric_links[:5])))
+
+                # Parse one snapshot of the expanded page locally for the
+                # element counts below
+                tree = lxml_html.fromstring(driver.page_source)
 
                 # Method 2: Look for btn-link class elements
-                btn_links = driver.find_elements(By.CSS_SELECTOR, "a.btn-link")
+                btn_links = BTN_LINKS_XPATH(tree)
                 print(f"   Found {len(btn_links)} btn-link elements")
 
                 # Method 3: Look for Generator.aspx links (PDF generation)
-                generator_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='Generator.aspx']")
+                generator_links = GENERATOR_LINKS_XPATH(tree)
                 print(f"   Found {len(generator_links)} Generator.aspx links")
 
                 if numeric_links or btn_links or generator_links:
@@ -193,7 +239,7 @@ def run_steps_1_2_3_4():
 
                     # Show some examples of what we found
                     if numeric_links:
-                        print(f"   Example report IDs: {[link.text.strip() for link in numeric_links[:3]]}")
+                        print(f"   Example report IDs: {numeric_links[:3]}")
 
                 else:
                     print("   ? Expanded 2025 but no report links found yet")
@@ -207,13 +253,14 @@ def run_steps_1_2_3_4():
 
             # Show what year labels we did find
             print("   Available year labels:")
-            for i, label in enumerate(year_labels):
-                print(f"     {i}: '{label.text.strip()}'")
+            if year_labels:
+                print("\n".join(f"     {i}: '{year_text}'" for i, year_text in enumerate(year_labels)))
 
         # Keep browser open for inspection
-        print(f"\nKeeping browser open for 20 seconds...")
-        print("You should now see the 2025 section expanded with individual reports")
-        time.sleep(20)
+        if HOLD_SECONDS:
+            print(f"\nKeeping browser open for {HOLD_SECONDS} seconds...")
+            print("You should now see the 2025 section expanded with individual reports")
+            time.sleep(HOLD_SECONDS)
 
         driver.quit()
         return True
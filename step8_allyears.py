@@ -7,24 +7,61 @@ Key strategies for captcha avoidance:
 - Human-like reading behavior
 - Process years in chronological order (most recent first)
 - Respectful request pacing
+
+Chrome reuses a persistent profile in ./.chrome_profile between runs; set
+MEC_FRESH_PROFILE=1 to start from a clean profile instead.
 """
 
+import os
 import random
 import time
-import pyautogui
 import re
 from pathlib import Path
 from datetime import datetime
+from lxml import etree
+from lxml import html as lxml_html
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Text shown on the report tab while the PDF is still being generated
+GENERATION_INDICATORS = [
+    "generating report",
+    "this may take several minutes",
+    "% completed",
+    "gathering the required information"
+]
+# Same test as scanning page_source and the body text, run inside the page
+GENERATION_CHECK_JS = """
+const html = document.documentElement.outerHTML.toLowerCase();
+const text = document.body.innerText.toLowerCase();
+return arguments[0].some(s => html.includes(s) || text.includes(s));
+"""
+
+# Downloaded files end in the numeric report ID, e.g. FHF_2025_Step8_256590.pdf
+RE_REPORT_ID_FILENAME = re.compile(r'(\d{5,})\.pdf$')
+RE_YEAR = re.compile(r'(20\d{2})')
+
+# Keys (data-cpid or link text) of the report links currently visible in the
+# reports table - compared before and after expanding a year
+VISIBLE_REPORT_LINKS_JS = """
+var table = document.getElementById('ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside');
+if (!table) return [];
+return Array.from(table.querySelectorAll('a.btn-link, a[data-cpid]'))
+    .filter(a => a.getClientRects().length > 0)
+    .map(a => a.getAttribute('data-cpid') || a.textContent.trim());
+"""
+
+# Year section labels inside the main reports table
+YEAR_LABELS_XPATH = etree.XPath(
+    "//*[@id='ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside']//span[contains(@id, 'lblYear')]")
+
+
 class StealthBrowser:
     """Enhanced stealth browser with anti-detection measures"""
 
@@ -59,12 +96,12 @@ def get_existing_report_ids(downloads_dir):
     """Get list of report IDs that have already been downloaded"""
     existing_ids = set()
 
-    for pdf_file in downloads_dir.glob("*.pdf"):
-        filename = pdf_file.name
-        match = re.search(r'(\d{5,})\.pdf$', filename)
-        if match:
-            report_id = match.group(1)
-            existing_ids.add(report_id)
+    # One directory listing; names are matched without touching each file
+    with os.scandir(downloads_dir) as entries:
+        for entry in entries:
+            match = RE_REPORT_ID_FILENAME.search(entry.name)
+            if match:
+                existing_ids.add(match.group(1))
 
     return existing_ids
 
@@ -77,18 +114,8 @@ def wait_for_generation_complete_simple(driver, max_wait=60):
         try:
             elapsed = int(time.time() - start_time)
 
-            page_source = driver.page_source.lower()
-            page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-
-            generation_indicators = [
-                "generating report",
-                "this may take several minutes",
-                "% completed",
-                "gathering the required information"
-            ]
-
-            still_generating = any(indicator in page_source or indicator in page_text
-                                 for indicator in generation_indicators)
+            # Check in the browser so only a boolean comes back, not the whole page
+            still_generating = driver.execute_script(GENERATION_CHECK_JS, GENERATION_INDICATORS)
 
             if not still_generating:
                 return True
@@ -106,6 +133,9 @@ def wait_for_generation_complete_simple(driver, max_wait=60):
 def download_pdf_simple(downloads_dir, target_filename):
     """Simple PDF download"""
     try:
+        # Checked once at startup by run_step_8_multi_year
+        import pyautogui
+
         pyautogui.hotkey('ctrl', 's')
         time.sleep(3)
 
@@ -130,10 +160,9 @@ def download_pdf_simple(downloads_dir, target_filename):
         return False, 0
 
 
-def download_single_report(driver, stealth, report_link, downloads_dir, year, report_num, total_reports):
+def download_single_report(driver, stealth, report_link, report_id, downloads_dir, year, report_num, total_reports):
     """Download a single report"""
 
-    report_id = report_link.text.strip()
     target_filename = f"FHF_{year}_Step8_{report_id}.pdf"
 
     print(f"    Report {report_num}/{total_reports}: {report_id}")
@@ -182,6 +211,9 @@ def download_single_report(driver, stealth, report_link, downloads_dir, year, re
     except Exception as e:
         print(f"      ERROR: {e}")
         try:
+            # Close the report tab so the next report's new-tab scan can't pick it up
+            if driver.current_window_handle != original_window:
+                driver.close()
             driver.switch_to.window(original_window)
         except:
             pass
@@ -197,15 +229,16 @@ def process_single_year(driver, stealth, year, downloads_dir, existing_ids):
         # IMPORTANT: Get fresh elements each time to avoid stale references
         main_table = driver.find_element("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
         expand_buttons = main_table.find_elements("css selector", "input[id*='ImgRptRight']")
-        year_labels = main_table.find_elements("css selector", "span[id*='lblYear']")
+        # All label texts in one round-trip instead of one .text call per label
+        year_texts = driver.execute_script(
+            "return Array.from(arguments[0].querySelectorAll(\"span[id*='lblYear']\"))"
+            ".map(e => e.innerText.trim());",
+            main_table)
 
         # Find the specific year and its expand button
-        year_index = None
-        for i, label in enumerate(year_labels):
-            if str(year) in label.text.strip():
-                year_index = i
-                print(f"  Found {year} at index {i}")
-                break
+        year_index = next((i for i, year_text in enumerate(year_texts) if str(year) in year_text), None)
+        if year_index is not None:
+            print(f"  Found {year} at index {year_index}")
 
         if year_index is None or year_index >= len(expand_buttons):
             print(f"  Year {year} not found or no expand button")
@@ -216,11 +249,18 @@ def process_single_year(driver, stealth, year, downloads_dir, existing_ids):
 
         # Click to expand this specific year
         print(f"  Expanding {year} section...")
+        # Links from years expanded earlier can still be visible, so remember
+        # them and wait for one that only this year's expansion shows
+        links_before = set(driver.execute_script(VISIBLE_REPORT_LINKS_JS))
         stealth.human_click(expand_button)
-        stealth.mimic_reading(4)  # Wait for expansion
+        stealth.mimic_reading(random.uniform(2, 4))  # Wait for expansion
 
-        # Wait for the specific year's content to load
-        time.sleep(5)
+        # Wait for the year's report links instead of a fixed pause
+        try:
+            WebDriverWait(driver, 15, poll_frequency=0.5).until(
+                lambda d: not links_before.issuperset(d.execute_script(VISIBLE_REPORT_LINKS_JS)))
+        except Exception:
+            print(f"  No new report links became visible for {year}")
 
         # Now find ALL links on the page and try to identify which belong to this year
         # This is tricky - we need to find links that appeared after expanding this year
@@ -233,27 +273,31 @@ def process_single_year(driver, stealth, year, downloads_dir, existing_ids):
                 if link_text.isdigit() and len(link_text) >= 5:
                     # Check if this link is visible and belongs to our year section
                     if link.is_displayed():
-                        potential_report_links.append(link)
+                        # Keep the ID with the link so it is only read from the browser once
+                        potential_report_links.append((link_text, link))
             except:
                 continue
 
         print(f"  Found {len(potential_report_links)} potential report links")
 
-        # Filter out already downloaded reports
+        # Filter out already downloaded reports, and IDs listed more than once
+        # (links from previously expanded years can stay visible on the page)
+        queued_ids = set()
         new_report_links = []
         skipped_count = 0
-
-        for link in potential_report_links:
-            try:
-                report_id = link.text.strip()
-                if report_id in existing_ids:
-                    skipped_count += 1
-                else:
-                    new_report_links.append(link)
-            except:
-                continue
+        duplicate_count = 0
+        for report_id, link in potential_report_links:
+            if report_id in existing_ids:
+                skipped_count += 1
+            elif report_id in queued_ids:
+                duplicate_count += 1
+            else:
+                queued_ids.add(report_id)
+                new_report_links.append((report_id, link))
 
         print(f"  Skipped {skipped_count} already downloaded")
+        if duplicate_count:
+            print(f"  Ignored {duplicate_count} duplicate report links")
         print(f"  Will attempt to download {len(new_report_links)} new reports")
 
         if len(new_report_links) == 0:
@@ -263,16 +307,15 @@ def process_single_year(driver, stealth, year, downloads_dir, existing_ids):
         # Download new reports for this year
         successful_downloads = 0
 
-        for i, report_link in enumerate(new_report_links):
+        for i, (report_id, report_link) in enumerate(new_report_links):
             try:
                 success, file_size = download_single_report(
-                    driver, stealth, report_link, downloads_dir, year, i+1, len(new_report_links)
+                    driver, stealth, report_link, report_id, downloads_dir, year, i+1, len(new_report_links)
                 )
 
                 if success:
                     successful_downloads += 1
                     # Add to existing_ids to avoid downloading again
-                    report_id = report_link.text.strip()
                     existing_ids.add(report_id)
 
                 # Pause between downloads within a year
@@ -302,6 +345,15 @@ def run_step_8_multi_year():
     print("Each committee may have different years available")
     print("This may take 45-90 minutes for committees with many years")
 
+    # Reports are saved through pyautogui, which also needs a display to load -
+    # find out now rather than after the first report has been generated
+    try:
+        import pyautogui
+    except Exception as e:
+        print(f"\nERROR: pyautogui could not be loaded ({e})")
+        print("Step 8 saves reports with pyautogui - install it and run with a display")
+        return False
+
     # Check existing files
     existing_ids = get_existing_report_ids(downloads_dir)
     print(f"\nFound {len(existing_ids)} existing reports to skip")
@@ -316,6 +368,13 @@ def run_step_8_multi_year():
     chrome_options.add_argument('--window-size=1366,768')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
 
+    # Reuse one Chrome profile between runs so the HTTP cache and cookies are
+    # already warm; set MEC_FRESH_PROFILE=1 to start from a clean profile
+    if os.environ.get("MEC_FRESH_PROFILE", "").strip() in ("", "0"):
+        profile_dir = Path.cwd() / ".chrome_profile"
+        profile_dir.mkdir(exist_ok=True)
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+
     prefs = {
         "plugins.always_open_pdf_externally": False,
         "download.default_directory": str(downloads_dir)
@@ -351,30 +410,29 @@ def run_step_8_multi_year():
 
         reports_link = driver.find_element("link text", "Reports")
         stealth.human_click(reports_link)
-        stealth.mimic_reading(4)
+        # Wait for the reports table itself, then a short human-looking pause
+        wait.until(EC.presence_of_element_located(("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")))
+        stealth.mimic_reading(random.uniform(1, 3))
 
         # Discover ALL available years - IMPROVED VERSION
         print(f"2. Discovering ALL available years...")
 
-        # Get fresh elements
-        main_table = driver.find_element("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
-        year_labels = main_table.find_elements("css selector", "span[id*='lblYear']")
+        # Read the year labels from one parsed snapshot of the page rather
+        # than asking the browser for each label's text
+        tree = lxml_html.fromstring(driver.page_source)
+        year_labels = YEAR_LABELS_XPATH(tree)
 
-        available_years = []
+        available_years = set()
         print("   Available year sections:")
         for i, label in enumerate(year_labels):
-            year_text = label.text.strip()
+            year_text = label.text_content().strip()
             print(f"     Section {i}: '{year_text}'")
 
             # Extract 4-digit year - be more flexible with matching
-            year_matches = re.findall(r'(20\d{2})', year_text)
-            for year_match in year_matches:
-                year = int(year_match)
-                if year not in available_years:
-                    available_years.append(year)
+            available_years.update(int(year_match) for year_match in RE_YEAR.findall(year_text))
 
         # Sort years in reverse chronological order (most recent first)
-        available_years.sort(reverse=True)
+        available_years = sorted(available_years, reverse=True)
         print(f"   Extracted years: {available_years}")
 
         if len(available_years) == 0:
@@ -429,7 +487,9 @@ def run_step_8_multi_year():
         print(f"Reports skipped (existing): {session_stats['total_skipped']}")
         print(f"NEW reports downloaded: {session_stats['total_downloaded']}")
 
-        final_existing_ids = get_existing_report_ids(downloads_dir)
+        # existing_ids was extended after every successful (verified on disk)
+        # download, so it already reflects the directory - no need to rescan
+        final_existing_ids = existing_ids
         print(f"Total unique reports now in directory: {len(final_existing_ids)}")
 
         if session_stats['total_downloaded'] > 0:
@@ -0,0 +1,109 @@
+import csv
+import io
+import unittest
+from datetime import datetime
+
+import Extractor
+from Extractor import FHFDataExtractor, page_markers
+
+
+SUMMARY_PAGE = """COMMITTEE QUARTERLY REPORT
+REPORT SUMMARY
+Money On Hand at the beginning of this reporting period
+All Monetary Contributions Received This Period 500.00
+Money On Hand at the close of this reporting period 1,234.56
+Expenditures made by cash or check this period 75.25
+"""
+
+
+class ExtractSummaryDataTest(unittest.TestCase):
+    def setUp(self):
+        self.extractor = FHFDataExtractor()
+
+    def test_label_inside_previous_labels_gap_is_still_found(self):
+        # The beginning balance is blank, so its amount search runs on into the
+        # next label - that label must still be matched on its own
+        pages = [SUMMARY_PAGE]
+        summary = self.extractor.extract_summary_data(pages, [page_markers(SUMMARY_PAGE)])
+
+        self.assertEqual(summary['monetary_receipts_period'], 500.0)
+        self.assertEqual(summary['money_on_hand_beginning'], 500.0)
+        self.assertEqual(summary['money_on_hand_ending'], 1234.56)
+        self.assertEqual(summary['total_expenditures_period'], 75.25)
+
+    def test_primary_label_wins_over_fallback(self):
+        page = ("REPORT SUMMARY\n"
+                "Total All expenditures made this period 10.00\n"
+                "Expenditures made by cash or check this period 20.00\n")
+        summary = self.extractor.extract_summary_data([page])
+
+        self.assertEqual(summary, {'total_expenditures_period': 20.0})
+
+
+class ProcessReportDataTest(unittest.TestCase):
+    def setUp(self):
+        self.extractor = FHFDataExtractor()
+        self.outputs = {}
+        for name, cols in (('summary', Extractor.SUMMARY_COLS),
+                           ('contribution', Extractor.CONTRIBUTION_COLS),
+                           ('expenditure', Extractor.EXPENDITURE_COLS)):
+            self.outputs[name] = io.StringIO()
+            writer = csv.DictWriter(self.outputs[name], fieldnames=cols)
+            writer.writeheader()
+            setattr(self.extractor, f'{name}_writer', writer)
+
+    def rows(self, name):
+        return list(csv.DictReader(io.StringIO(self.outputs[name].getvalue())))
+
+    def report(self, file_date):
+        return {
+            'filename': 'FHF_2024_Step8_100003.pdf',
+            'committee_name': 'Francis Howell Families',
+            'report_type': 'Quarterly',
+            'period_from': '01/01/2024',
+            'period_through': '03/31/2024',
+            'file_date': file_date,
+            'is_amendment': False,
+            'summary': {'money_on_hand_ending': 2734.31},
+            'contributions': [{
+                'contributor_name': 'Jane Doe', 'contributor_address': '123 Main St, Saint Charles MO 63301',
+                'date_received': '01/15/2024', 'individual_amount': 100.0, 'aggregate_amount': 100.0,
+                'contribution_type': 'Monetary', 'employer': 'Acme', 'occupation': 'Engineer'
+            }],
+            'expenditures': [{
+                'expense_category': 'Printing', 'amount': 225.5, 'recipient_name': 'Print Shop',
+                'recipient_address': '', 'purpose': 'Printing', 'date_paid': ''
+            }],
+        }
+
+    def test_written_rows(self):
+        self.extractor.process_report_data(self.report(datetime(2024, 4, 15)))
+
+        summary, = self.rows('summary')
+        self.assertEqual(summary['file_date'], '2024-04-15')
+        self.assertEqual(summary['money_on_hand_ending'], '2734.31')
+        self.assertEqual(summary['money_on_hand_beginning'], '0.0')
+        self.assertEqual(summary['is_amendment'], 'False')
+
+        contribution, = self.rows('contribution')
+        self.assertEqual(contribution['contributor_name'], 'Jane Doe')
+        self.assertEqual(contribution['individual_amount'], '100.0')
+        self.assertEqual(contribution['filename'], 'FHF_2024_Step8_100003.pdf')
+        self.assertEqual(contribution['report_period_through'], '03/31/2024')
+
+        expenditure, = self.rows('expenditure')
+        # Missing payment dates fall back to the start of the period
+        self.assertEqual(expenditure['date_paid'], '01/01/2024')
+        self.assertEqual(expenditure['amount'], '225.5')
+
+        self.assertEqual((self.extractor.summary_count, self.extractor.contribution_count,
+                          self.extractor.expenditure_count), (1, 1, 1))
+
+    def test_file_date_keeps_time_when_present(self):
+        self.extractor.process_report_data(self.report(datetime(2024, 4, 15, 9, 30)))
+
+        self.assertEqual(self.rows('summary')[0]['file_date'], '2024-04-15 09:30:00')
+
+
+if __name__ == '__main__':
+    unittest.main()